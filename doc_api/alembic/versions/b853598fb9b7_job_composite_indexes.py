@@ -0,0 +1,46 @@
+"""job composite indexes
+
+Revision ID: b853598fb9b7
+Revises: 803f39610312
+Create Date: 2026-10-17 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b853598fb9b7'
+down_revision: Union[str, Sequence[str], None] = '803f39610312'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_state_created_date', 'jobs', ['state', 'created_date'], unique=False)
+    op.create_index('ix_jobs_state_last_change', 'jobs', ['state', 'last_change'], unique=False)
+    op.create_index('ix_jobs_owner_key_id_state', 'jobs', ['owner_key_id', 'state'], unique=False)
+    op.drop_index(op.f('ix_jobs_state'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_owner_key_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_progress'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_alto_required'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_page_required'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_meta_json_required'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_meta_json_uploaded'), table_name='jobs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_jobs_meta_json_uploaded'), 'jobs', ['meta_json_uploaded'], unique=False)
+    op.create_index(op.f('ix_jobs_meta_json_required'), 'jobs', ['meta_json_required'], unique=False)
+    op.create_index(op.f('ix_jobs_page_required'), 'jobs', ['page_required'], unique=False)
+    op.create_index(op.f('ix_jobs_alto_required'), 'jobs', ['alto_required'], unique=False)
+    op.create_index(op.f('ix_jobs_progress'), 'jobs', ['progress'], unique=False)
+    op.create_index(op.f('ix_jobs_owner_key_id'), 'jobs', ['owner_key_id'], unique=False)
+    op.create_index(op.f('ix_jobs_state'), 'jobs', ['state'], unique=False)
+    op.drop_index('ix_jobs_owner_key_id_state', table_name='jobs')
+    op.drop_index('ix_jobs_state_last_change', table_name='jobs')
+    op.drop_index('ix_jobs_state_created_date', table_name='jobs')
@@ -1,5 +1,4 @@
 import base64
-import hashlib
 import hmac
 import logging
 import os
@@ -155,7 +154,8 @@ def _rand_urlsafe(nbytes: int) -> str:
 def salted_hmac_sha256_hex(secret: str, salt: str) -> str:
     # Simple and solid: HMAC over secret using (global_secret || salt) as key
     key = (config.HMAC_SECRET + salt).encode()
-    return hmac.new(key, secret.encode(), hashlib.sha256).hexdigest()
+    # one-shot hmac.digest runs entirely in OpenSSL, no Python-level HMAC object
+    return hmac.digest(key, secret.encode(), "sha256").hex()
 
 def issue_key_components():
     kid = _rand_urlsafe(6)      # 8 chars ≈ 48 bits
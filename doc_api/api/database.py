@@ -1,9 +1,12 @@
 import os, asyncio
+import logging
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 from doc_api.config import config
 
+logger = logging.getLogger(__name__)
+
 global_engine = None
 global_async_session_maker = None
 _init_lock = None
@@ -43,6 +46,19 @@ async def open_session():
     async with sm() as session:
         yield session
 
+async def warm_pool(size: int):
+    # open `size` connections concurrently and return them to the pool
+    if size <= 0:
+        return
+    await _ensure_session_maker()
+    results = await asyncio.gather(*(global_engine.connect() for _ in range(size)), return_exceptions=True)
+    conns = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in conns))
+    if len(conns) < size:
+        logger.warning("DB pool warm-up opened only %d of %d connections.", len(conns), size)
+    else:
+        logger.info("DB pool warmed up with %d connections.", size)
+
 
 class DBError(Exception):
     pass
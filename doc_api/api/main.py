@@ -12,7 +12,8 @@ from fastapi.routing import APIRoute
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from sqlalchemy import select
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from doc_api.api.authentication import AUTHENTICATION_RESPONSES, issue_key_components, salted_hmac_sha256_hex, \
     parse_api_key
@@ -20,7 +21,7 @@ from doc_api.api.guards.general_guards import JOB_EXISTS_GUARD_RESPONSES
 from doc_api.api.guards.user_guards import USER_ACCESS_TO_NEW_JOB_GUARD_RESPONSES, USER_ACCESS_TO_JOB_GUARD_RESPONSES
 from doc_api.api.guards.worker_guards import WORKER_ACCESS_TO_JOB_GUARD_RESPONSES, WORKER_ACCESS_TO_PROCESSING_JOB_GUARD_RESPONSES
 from doc_api.api.schemas.base_objects import KeyRole
-from doc_api.api.database import open_session
+from doc_api.api.database import open_session, warm_pool
 from doc_api.api.routes import admin_router, debug_router, root_router
 from doc_api.api.schemas.responses import AppCode, validate_server_error_response, DocAPIResponseServerError, \
     DocAPIResponseClientError, DocAPIClientErrorException, validate_client_error_response, \
@@ -38,6 +39,9 @@ internal_mail_logger = get_internal_mail_logger().logger
 
 logger = logging.getLogger(__name__)
 
+# pg advisory lock key held while the admin key is seeded at startup ("DocAPI" in ASCII)
+ADMIN_KEY_SEED_LOCK_ID = 0x446F63415049
+
 
 tags_metadata = [
     {
@@ -65,9 +69,13 @@ tags_metadata = [
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await warm_pool(config.DATABASE_POOL_WARM_SIZE)
+
     if getattr(config, "ADMIN_KEY", None):
         kid, secret = parse_api_key(config.ADMIN_KEY)
         async with open_session() as db:
+            # every uvicorn worker runs this, serialize them so only the first one creates the key
+            await db.execute(select(func.pg_advisory_xact_lock(ADMIN_KEY_SEED_LOCK_ID)))
             result = await db.execute(
                 select(model.Key).where(model.Key.label == "admin").with_for_update()
             )
@@ -110,87 +118,38 @@ async def lifespan(app: FastAPI):
         )
 
     if not config.PRODUCTION:
-        _, _, test_admin_salt = issue_key_components()
-        test_admin_kid, test_admin_secret = parse_api_key(config.TEST_ADMIN_KEY)
-        test_admin_digest = salted_hmac_sha256_hex(test_admin_secret, test_admin_salt)
-
-        _, _, test_readonly_salt = issue_key_components()
-        test_readonly_kid, test_readonly_secret = parse_api_key(config.TEST_READONLY_KEY)
-        test_readonly_digest = salted_hmac_sha256_hex(test_readonly_secret, test_readonly_salt)
-
-        _, _, test_user_salt = issue_key_components()
-        test_user_kid, test_user_secret = parse_api_key(config.TEST_USER_KEY)
-        test_user_digest = salted_hmac_sha256_hex(test_user_secret, test_user_salt)
-
-        _, _, test_worker_salt = issue_key_components()
-        test_worker_kid, test_worker_secret = parse_api_key(config.TEST_WORKER_KEY)
-        test_worker_digest = salted_hmac_sha256_hex(test_worker_secret, test_worker_salt)
-
+        test_keys = []
+        for api_key, label, role in (
+            (config.TEST_ADMIN_KEY, config.TEST_ADMIN_KEY_LABEL, KeyRole.ADMIN),
+            (config.TEST_READONLY_KEY, config.TEST_READONLY_KEY_LABEL, KeyRole.READONLY),
+            (config.TEST_USER_KEY, config.TEST_USER_KEY_LABEL, KeyRole.USER),
+            (config.TEST_WORKER_KEY, config.TEST_WORKER_KEY_LABEL, KeyRole.WORKER),
+        ):
+            _, _, salt = issue_key_components()
+            kid, secret = parse_api_key(api_key)
+            test_keys.append({
+                "kid": kid,
+                "salt": salt,
+                "key_hash": salted_hmac_sha256_hex(secret, salt),
+                "label": label,
+                "active": True,
+                "role": role,
+            })
+
+        # one round-trip for all test keys, keys that already exist are left untouched
         async with open_session() as db:
             result = await db.execute(
-                select(model.Key).where(model.Key.kid.in_([
-                    test_admin_kid,
-                    test_readonly_kid,
-                    test_user_kid,
-                    test_worker_kid,
-                ]))
+                pg_insert(model.Key)
+                .values(test_keys)
+                .on_conflict_do_nothing(index_elements=[model.Key.kid])
+                .returning(model.Key.label)
             )
-            existing_keys = {k.kid for k in result.scalars().all()}
-
-            if test_admin_kid not in existing_keys:
-                db.add(
-                    model.Key(
-                        kid=test_admin_kid,
-                        salt=test_admin_salt,
-                        key_hash=test_admin_digest,
-                        label=config.TEST_ADMIN_KEY_LABEL,
-                        active=True,
-                        role=KeyRole.ADMIN,
-                    )
-                )
-                logger.info("Test admin API key created!")
-
-            if test_readonly_kid not in existing_keys:
-                db.add(
-                    model.Key(
-                        kid=test_readonly_kid,
-                        salt=test_readonly_salt,
-                        key_hash=test_readonly_digest,
-                        label=config.TEST_READONLY_KEY_LABEL,
-                        active=True,
-                        role=KeyRole.READONLY,
-                    )
-                )
-                logger.info("Test readonly API key created!")
-
-            if test_user_kid not in existing_keys:
-                db.add(
-                    model.Key(
-                        kid=test_user_kid,
-                        salt=test_user_salt,
-                        key_hash=test_user_digest,
-                        label=config.TEST_USER_KEY_LABEL,
-                        active=True,
-                        role=KeyRole.USER,
-                    )
-                )
-                logger.info("Test user API key created!")
-
-            if test_worker_kid not in existing_keys:
-                db.add(
-                    model.Key(
-                        kid=test_worker_kid,
-                        salt=test_worker_salt,
-                        key_hash=test_worker_digest,
-                        label=config.TEST_WORKER_KEY_LABEL,
-                        active=True,
-                        role=KeyRole.WORKER,
-                    )
-                )
-                logger.info("Test worker API key created!")
-
+            for label in result.scalars().all():
+                logger.info("Test API key '%s' created!", label)
             await db.commit()
 
+    # build the OpenAPI schema now so the first /docs or /openapi.json request does not pay for it
+    app.openapi()
 
     yield
 
@@ -31,7 +31,7 @@ from doc_api.api.schemas.responses import DocAPIResponseClientError, AppCode, Do
     validate_ok_response, DocAPIClientErrorException, GENERAL_RESPONSES
 from doc_api.api.validators.alto_validator import validate_alto_basic
 from doc_api.api.validators.page_validator import validate_page_basic
-from doc_api.api.validators.xml_validator import is_well_formed_xml
+from doc_api.api.validators.xml_validator import parse_xml
 from doc_api.db import model
 from doc_api.config import config
 
@@ -394,15 +394,16 @@ async def put_alto(
     db_image, code = await user_cruds.get_image_by_job_and_name(db=db, job_id=job_id, image_name=image_name)
     if code == AppCode.IMAGE_RETRIEVED:
         data = await file.read()
-        if not is_well_formed_xml(data):
+        root = parse_xml(data)
+        if root is None:
             raise DocAPIClientErrorException(
                 status=status.HTTP_400_BAD_REQUEST,
                 code=AppCode.XML_PARSE_ERROR,
                 detail=PUT_ALTO_RESPONSES[AppCode.XML_PARSE_ERROR]["detail"],
             )
-        alto_checks = validate_alto_basic(data)
+        alto_checks = validate_alto_basic(root, config.ALTO_VALIDATION)
         for check_type, check_val in alto_checks.items():
-            if config.ALTO_VALIDATION[check_type] and not check_val:
+            if check_type in config.ALTO_VALIDATION and not check_val:
                 raise DocAPIClientErrorException(
                     status=status.HTTP_422_UNPROCESSABLE_CONTENT,
                     code=AppCode.ALTO_SCHEMA_INVALID,
@@ -503,15 +504,16 @@ async def put_page(
     db_image, code = await user_cruds.get_image_by_job_and_name(db=db, job_id=job_id, image_name=image_name)
     if code == AppCode.IMAGE_RETRIEVED:
         data = await file.read()
-        if not is_well_formed_xml(data):
+        root = parse_xml(data)
+        if root is None:
             raise DocAPIClientErrorException(
                 status=status.HTTP_400_BAD_REQUEST,
                 code=AppCode.XML_PARSE_ERROR,
                 detail=PUT_PAGE_RESPONSES[AppCode.XML_PARSE_ERROR]["detail"],
             )
-        page_checks = validate_page_basic(data)
+        page_checks = validate_page_basic(root, config.PAGE_VALIDATION)
         for check_type, check_val in page_checks.items():
-            if config.PAGE_VALIDATION[check_type] and not check_val:
+            if check_type in config.PAGE_VALIDATION and not check_val:
                 raise DocAPIClientErrorException(
                     status=status.HTTP_422_UNPROCESSABLE_CONTENT,
                     code=AppCode.PAGE_SCHEMA_INVALID,
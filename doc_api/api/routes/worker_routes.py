@@ -22,7 +22,8 @@ from doc_api.api.routes.helper import RouteInvariantError
 from doc_api.api.guards.worker_guards import challenge_worker_access_to_processing_job
 from doc_api.api.schemas import base_objects
 from doc_api.api.schemas.responses import AppCode, DocAPIResponseOK, \
-    DocAPIResponseClientError, DocAPIClientErrorException, make_responses, GENERAL_RESPONSES, validate_ok_response
+    DocAPIResponseClientError, DocAPIClientErrorException, make_responses, GENERAL_RESPONSES, validate_ok_response, \
+    no_content_response
 from doc_api.db import model
 from doc_api.config import config
 
@@ -148,11 +149,7 @@ async def delete_lease(
     code = await worker_cruds.release_job_lease(db=db, job_id=job_id)
 
     if code == AppCode.JOB_LEASE_RELEASED:
-        return validate_ok_response(DocAPIResponseOK[NoneType](
-            status=fastapi.status.HTTP_204_NO_CONTENT,
-            code=AppCode.JOB_LEASE_RELEASED,
-            detail=""
-        ))
+        return no_content_response()
 
     raise RouteInvariantError(code=code, request=request)
 
@@ -1,12 +1,22 @@
 import enum
+import sys
 from datetime import datetime
 from typing import Optional, get_origin, Union, get_args, List, Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from doc_api.config import config
 
-class ProcessingState(str, enum.Enum):
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    class StrEnum(str, enum.Enum):
+        pass
+
+
+class ProcessingState(StrEnum):
     NEW = 'new'
     QUEUED = 'queued'
     PROCESSING = 'processing'
@@ -16,45 +26,57 @@ class ProcessingState(str, enum.Enum):
     FAILED = 'failed'
 
 
-class KeyRole(str, enum.Enum):
+class KeyRole(StrEnum):
     READONLY = 'readonly'
     USER = 'user'
     WORKER = 'worker'
     ADMIN = 'admin'
 
 
+_DOC_ONLY_FIELD_KWARGS = ("description", "examples", "json_schema_extra")
+
+if config.FIELD_WITH_DOCS:
+    _field = Field
+else:
+    def _field(*args, **kwargs):
+        """Field() without the metadata that is only used for OpenAPI docs."""
+        for key in _DOC_ONLY_FIELD_KWARGS:
+            kwargs.pop(key, None)
+        return Field(*args, **kwargs)
+
+
 class Image(BaseModel):
-    id: Optional[UUID] = Field(
+    id: Optional[UUID] = _field(
         None,
         examples=["550e8400-e29b-41d4-a716-446655440000"],
         description="Unique identifier of the image."
     )
 
-    name: str = Field(
+    name: str = _field(
         ...,
         examples=["page_001.jpg"],
         description="Original file name of the image."
     )
 
-    order: int = Field(
+    order: int = _field(
         ...,
         examples=[1],
         description="Sequential order of the image within the associated document or job."
     )
 
-    image_uploaded: bool = Field(
+    image_uploaded: bool = _field(
         ...,
         examples=[True],
         description="Indicates whether the image file has been successfully uploaded."
     )
 
-    alto_uploaded: bool = Field(
+    alto_uploaded: bool = _field(
         ...,
         examples=[False],
         description="Indicates whether the corresponding ALTO (OCR) file has been uploaded."
     )
 
-    page_uploaded: bool = Field(
+    page_uploaded: bool = _field(
         ...,
         examples=[False],
         description="Indicates whether the corresponding PAGE XML file has been uploaded."
@@ -64,25 +86,25 @@ class Image(BaseModel):
 
 
 class ImageUpdate(BaseModel):
-    image_uploaded: Optional[bool] = Field(
+    image_uploaded: Optional[bool] = _field(
         None,
         examples=[True],
         description="Indicates whether the image file has been successfully uploaded."
     )
 
-    alto_uploaded: Optional[bool] = Field(
+    alto_uploaded: Optional[bool] = _field(
         None,
         examples=[False],
         description="Indicates whether the corresponding ALTO XML file has been uploaded."
     )
 
-    page_uploaded: Optional[bool] = Field(
+    page_uploaded: Optional[bool] = _field(
         None,
         examples=[False],
         description="Indicates whether the corresponding PAGE XML file has been uploaded."
     )
 
-    imagehash: Optional[str] = Field(
+    imagehash: Optional[str] = _field(
         None,
         examples=["d41d8cd98f00b204e9800998ecf8427e"],
         description="MD5 hash of the image file for integrity verification."
@@ -90,86 +112,86 @@ class ImageUpdate(BaseModel):
 
 
 class JobProper(BaseModel):
-    id: UUID = Field(
+    id: UUID = _field(
         ...,
         examples=["550e8400-e29b-41d4-a716-446655440000"],
         description="Unique identifier of the job."
     )
 
-    state: ProcessingState = Field(
+    state: ProcessingState = _field(
         ...,
         examples=[ProcessingState.QUEUED.value],
         description="Current state of the job."
     )
 
-    progress: float = Field(
+    progress: float = _field(
         ...,
         examples=[0.65],
         description="Progress of the job (0.0 - 1.0)."
     )
 
-    previous_attempts: Optional[int] = Field(
+    previous_attempts: Optional[int] = _field(
         None,
         examples=[1],
         description="Number of previous attempts if the job was retried."
     )
 
-    meta_json_uploaded :  bool = Field(
+    meta_json_uploaded :  bool = _field(
         ...,
         examples=[False],
         description="Whether Meta JSON file has been uploaded for this job."
     )
 
-    meta_json_required : bool = Field(
+    meta_json_required : bool = _field(
         ...,
         examples=[True],
         description="Whether Meta JSON file is required for this job."
     )
 
-    alto_required : bool = Field(
+    alto_required : bool = _field(
         ...,
         examples=[True],
         description="Whether ALTO XML file is required for this job."
     )
 
-    page_required : bool = Field(
+    page_required : bool = _field(
         ...,
         examples=[False],
         description="Whether PAGE XML file is required for this job."
     )
 
-    created_date: datetime = Field(
+    created_date: datetime = _field(
         ...,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when the job was created."
     )
 
-    started_date: Optional[datetime] = Field(
+    started_date: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when processing started."
     )
 
-    last_change: datetime = Field(
+    last_change: datetime = _field(
         ...,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp of the last state change."
     )
 
-    finished_date: Optional[datetime] = Field(
+    finished_date: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when the job was finished."
     )
 
-    log_user: Optional[str] = Field(
+    log_user: Optional[str] = _field(
         None,
         examples=["USER log."],
         description="User facing log message displayed in the interface. "
                     "Helps indicate current processing step or progress in human-readable form."
     )
 
-    log: Optional[str] = Field(
+    log: Optional[str] = _field(
         None,
         examples=["ADMIN log."],
         description=(
@@ -182,12 +204,12 @@ class JobProper(BaseModel):
 
 
 class JobWithEngine(JobProper):
-    engine_name: Optional[str] = Field(
+    engine_name: Optional[str] = _field(
         None,
         examples=["Engine A"],
         description="Name of the engine assigned to this job."
     )
-    engine_version: Optional[str] = Field(
+    engine_version: Optional[str] = _field(
         None,
         examples=["v1.0.0"],
         description="Version of the engine assigned to this job."
@@ -195,35 +217,35 @@ class JobWithEngine(JobProper):
 
 
 class Job(JobWithEngine):
-    engine_id: Optional[UUID] = Field(
+    engine_id: Optional[UUID] = _field(
         None,
         examples=["a1b2c3d4-e5f6-47a8-9abc-def012345678"],
         description="Unique identifier of the engine assigned to this job."
     )
-    engine_files_updated: Optional[datetime] = Field(
+    engine_files_updated: Optional[datetime] = _field(
         None,
         examples=["2025-10-15T09:15:00+00:00"],
         description="UTC timestamp of the last time files related to the engine were updated."
     )
-    engine_definition: Optional[dict] = Field(
+    engine_definition: Optional[dict] = _field(
         None,
         examples=[{"param1": "value1", "param2": 42}],
         description="JSON definition/configuration of the engine assigned to this job."
     )
-    images: List[Image] = Field(
+    images: List[Image] = _field(
         ...,
         description="List of images associated with this job."
     )
 
 
 class JobUpdate(BaseModel):
-    state: Optional[ProcessingState] = Field(
+    state: Optional[ProcessingState] = _field(
         None,
         description="New state of the job.",
         examples=[ProcessingState.PROCESSING.value]
     )
 
-    progress: Optional[float] = Field(
+    progress: Optional[float] = _field(
         None,
         description=(
             "Current completion percentage of the job (0.0–100.0). "
@@ -232,61 +254,61 @@ class JobUpdate(BaseModel):
         examples=[0.5]
     )
 
-    previous_attempts: Optional[int] = Field(
+    previous_attempts: Optional[int] = _field(
         None,
         examples=[1],
         description="Number of previous attempts if the job was retried."
     )
 
-    meta_json_uploaded: Optional[bool] = Field(
+    meta_json_uploaded: Optional[bool] = _field(
         None,
         description="Whether the metadata JSON has been uploaded for this job.",
         examples=[True]
     )
 
-    meta_json_required: Optional[bool] = Field(
+    meta_json_required: Optional[bool] = _field(
         None,
         examples=[True],
         description="Whether Meta JSON file is required for this job."
     )
 
-    alto_required: Optional[bool] = Field(
+    alto_required: Optional[bool] = _field(
         None,
         examples=[True],
         description="Whether ALTO XML file is required for this job."
     )
 
-    page_required: Optional[bool] = Field(
+    page_required: Optional[bool] = _field(
         None,
         examples=[False],
         description="Whether PAGE XML file is required for this job."
     )
 
-    created_date: Optional[datetime] = Field(
+    created_date: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when the job was created."
     )
 
-    started_date: Optional[datetime] = Field(
+    started_date: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when processing started."
     )
 
-    last_change: Optional[datetime] = Field(
+    last_change: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp of the last state change."
     )
 
-    finished_date: Optional[datetime] = Field(
+    finished_date: Optional[datetime] = _field(
         None,
         examples=["2025-10-18T21:30:00+00:00"],
         description="UTC timestamp when the job was finished."
     )
 
-    log: Optional[str] = Field(
+    log: Optional[str] = _field(
         None,
         description=(
             "Technical or debug log text appended to the internal system log. "
@@ -295,7 +317,7 @@ class JobUpdate(BaseModel):
         examples=["Loaded 500 image tiles and initialized OCR engine."]
     )
 
-    log_user: Optional[str] = Field(
+    log_user: Optional[str] = _field(
         None,
         description=(
             "User-facing log message displayed in the interface. "
@@ -306,13 +328,13 @@ class JobUpdate(BaseModel):
 
 
 class JobProgressUpdate(BaseModel):
-    state: Optional[ProcessingState] = Field(
+    state: Optional[ProcessingState] = _field(
         None,
         description="New state of the job.",
         examples=[ProcessingState.PROCESSING.value]
     )
 
-    progress: Optional[float] = Field(
+    progress: Optional[float] = _field(
         None,
         description=(
             "Current completion percentage of the job (0.0–100.0). "
@@ -321,7 +343,7 @@ class JobProgressUpdate(BaseModel):
         examples=[0.5]
     )
 
-    log: Optional[str] = Field(
+    log: Optional[str] = _field(
         None,
         description=(
             "Technical or debug log text appended to the internal system log. "
@@ -330,7 +352,7 @@ class JobProgressUpdate(BaseModel):
         examples=["Loaded 500 image tiles and initialized OCR engine."]
     )
 
-    log_user: Optional[str] = Field(
+    log_user: Optional[str] = _field(
         None,
         description=(
             "User-facing log message displayed in the interface. "
@@ -347,12 +369,12 @@ class JobLease(BaseModel):
     Represents a temporary lease (heartbeat) information for a processing job.
     Returned when a worker reports activity to confirm that it is still alive.
     """
-    id: UUID = Field(
+    id: UUID = _field(
         ...,
         description="Unique identifier of the job whose lease was renewed.",
         examples=["9fdc1a4c-022c-4ba3-9ea4-69dcfeb1b9d3"]
     )
-    lease_expire_at: datetime = Field(
+    lease_expire_at: datetime = _field(
         ...,
         description=(
             "UTC timestamp when the job's lease will expire if no further heartbeats are received. "
@@ -360,7 +382,7 @@ class JobLease(BaseModel):
         ),
         examples=["2025-10-18T21:30:00+00:00"]
     )
-    server_time: datetime = Field(
+    server_time: datetime = _field(
         ...,
         description=(
             "UTC time on the server when this lease information was generated. "
@@ -377,37 +399,37 @@ class Key(BaseModel):
     and timestamps for creation and last usage.
     """
 
-    id: UUID = Field(
+    id: UUID = _field(
         ...,
         description="Unique identifier of the API key (UUIDv4).",
         examples=["c69bb0b5-16b8-47d4-9f78-c5a1d3f4f2d7"],
     )
 
-    label: str = Field(
+    label: str = _field(
         ...,
         description="Human-readable label for identifying the key, e.g., the client or worker name.",
         examples=["My Application Key"],
     )
 
-    role: KeyRole = Field(
+    role: KeyRole = _field(
         ...,
         description="Role associated with this key, determining access level (e.g., ADMIN, USER, WORKER).",
         examples=[KeyRole.USER.value],
     )
 
-    active: bool = Field(
+    active: bool = _field(
         ...,
         description="Whether the key is currently active and permitted to access the API.",
         examples=[True],
     )
 
-    created_date: datetime = Field(
+    created_date: datetime = _field(
         ...,
         description="Timestamp when the key was created (in UTC).",
         examples=["2025-01-15T10:24:30+00:00"],
     )
 
-    last_used: Optional[datetime] = Field(
+    last_used: Optional[datetime] = _field(
         None,
         description="Timestamp of the last successful usage of this key (in UTC). May be null if unused.",
         examples=["2025-10-20T07:55:10+00:00"],
@@ -417,12 +439,12 @@ class Key(BaseModel):
 
 
 class KeyNew(BaseModel):
-    label: str = Field(
+    label: str = _field(
         ...,
         description="Human-readable label for identifying the key, e.g., the client or worker name.",
         examples=["My Application Key"],
     )
-    role: KeyRole = Field(
+    role: KeyRole = _field(
         ...,
         description=f"Role to assign to the new key, determining access level (e.g. {', '.join(r.value for r in KeyRole)}).",
         examples=[KeyRole.USER.value, KeyRole.WORKER.value, KeyRole.ADMIN.value],
@@ -446,7 +468,7 @@ class KeySecret(BaseModel):
     This value is only shown at creation time and is required for authentication.
     """
 
-    secret: str = Field(
+    secret: str = _field(
         ...,
         description="The secret value of the API key used for authentication.",
         examples=["abcd1234efgh5678ijkl9012mnop3456qrst7890uvwx"],
@@ -454,52 +476,52 @@ class KeySecret(BaseModel):
 
 
 class Engine(BaseModel):
-    id: Optional[UUID] = Field(
+    id: Optional[UUID] = _field(
         None,
         description="Unique identifier of the engine (UUIDv4).",
         examples=["a1b2c3d4-e5f6-47a8-9abc-def012345678"],
     )
-    name: str = Field(
+    name: str = _field(
         ...,
         description="Name of the engine.",
         examples=["Engine A"],
     )
-    version: str = Field(
+    version: str = _field(
         ...,
         description="Version of the engine.",
         examples=["v1.0.0"],
     )
-    description: str = Field(
+    description: str = _field(
         ...,
         description="Description of the engine.",
         examples=["An advanced OCR engine optimized for historical documents."],
     )
-    definition: Optional[dict] = Field(
+    definition: Optional[dict] = _field(
         None,
         description="JSON definition/configuration of the engine.",
         examples=[{"param1": "value1", "param2": 42}],
     )
-    default: bool = Field(
+    default: bool = _field(
         ...,
         description="Whether this engine is the default choice for jobs.",
         examples=[True],
     )
-    active: Optional[bool] = Field(
+    active: Optional[bool] = _field(
         None,
         description="Whether this engine is currently active and available for use.",
         examples=[True],
     )
-    created_date: Optional[datetime] = Field(
+    created_date: Optional[datetime] = _field(
         None,
         description="Timestamp when the engine was added (in UTC).",
         examples=["2025-02-20T14:45:00+00:00"],
     )
-    last_used: Optional[datetime] = Field(
+    last_used: Optional[datetime] = _field(
         None,
         description="Timestamp of the last time this engine was used (in UTC). May be null if unused.",
         examples=["2025-10-22T11:30:00+00:00"],
     )
-    files_updated: Optional[datetime] = Field(
+    files_updated: Optional[datetime] = _field(
         None,
         description="Timestamp of the last time files related to this engine were updated (in UTC).",
         examples=["2025-10-15T09:15:00+00:00"],
@@ -509,32 +531,32 @@ class Engine(BaseModel):
 
 
 class EngineNew(BaseModel):
-    name: str = Field(
+    name: str = _field(
         ...,
         description="Name of the engine.",
         examples=["Engine A"],
     )
-    version: str = Field(
+    version: str = _field(
         ...,
         description="Version of the engine.",
         examples=["v1.0.0"],
     )
-    description: str = Field(
+    description: str = _field(
         ...,
         description="Description of the engine.",
         examples=["An advanced OCR engine optimized for historical documents."],
     )
-    definition: dict = Field(
+    definition: dict = _field(
         ...,
         description="JSON definition/configuration of the engine.",
         examples=[{"param1": "value1", "param2": 42}],
     )
-    default: Optional[bool] = Field(
+    default: Optional[bool] = _field(
         False,
         description="Whether this engine should be the default choice for jobs.",
         examples=[False],
     )
-    active: Optional[bool] = Field(
+    active: Optional[bool] = _field(
         True,
         description="Whether this engine is currently active and available for use.",
         examples=[True],
@@ -544,32 +566,32 @@ class EngineNew(BaseModel):
 
 
 class EngineUpdate(BaseModel):
-    name: Optional[str] = Field(
+    name: Optional[str] = _field(
         None,
         description="Name of the engine.",
         examples=["Engine A"],
     )
-    version: Optional[str] = Field(
+    version: Optional[str] = _field(
         None,
         description="Version of the engine.",
         examples=["v1.0.0"],
     )
-    description: Optional[str] = Field(
+    description: Optional[str] = _field(
         None,
         description="Description of the engine.",
         examples=["An advanced OCR engine optimized for historical documents."],
     )
-    definition: Optional[dict] = Field(
+    definition: Optional[dict] = _field(
         None,
         description="JSON definition/configuration of the engine.",
         examples=[{"param1": "value1", "param2": 42}],
     )
-    default: Optional[bool] = Field(
+    default: Optional[bool] = _field(
         None,
         description="Whether this engine should be the default choice for jobs.",
         examples=[True],
     )
-    active: Optional[bool] = Field(
+    active: Optional[bool] = _field(
         None,
         description="Whether this engine is currently active and available for use.",
         examples=[True],
@@ -1,18 +1,18 @@
-import enum, logging
-from typing import Generic, TypeVar, Optional, Any, Mapping, Dict, Type, get_origin, get_args
+import functools, logging, sys
+from types import MappingProxyType
+from typing import ClassVar, Generic, TypeVar, Optional, Any, Mapping, Dict, Type, Tuple, NamedTuple, get_origin, get_args
 
 import fastapi
-from pydantic import BaseModel, Field, model_validator, field_validator
-from fastapi.responses import JSONResponse, Response
-from collections import defaultdict
+from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import Response
 
-from doc_api.api.schemas.base_objects import model_example
+from doc_api.api.schemas.base_objects import StrEnum, model_example
 
 
 logger = logging.getLogger(__name__)
 
 # Naming convention for AppCode: CATEGORY_ACTION
-class AppCode(str, enum.Enum):
+class AppCode(StrEnum):
     API_KEY_VALID = 'API_KEY_VALID'
 
     # User-related
@@ -142,14 +142,14 @@ class AppCode(str, enum.Enum):
     INTERNAL_ERROR = 'INTERNAL_ERROR'
     HTTP_ERROR = 'HTTP_ERROR'
 
-DETAILS_GENERAL = {
+DETAILS_GENERAL = MappingProxyType({
     # 4xx
     AppCode.HTTP_ERROR: "An HTTP error occurred.",
     AppCode.REQUEST_VALIDATION_ERROR: "The request could not be validated.",
 
     # 5xx
     AppCode.INTERNAL_ERROR: "An internal server error occurred.",
-}
+})
 
 T = TypeVar("T")
 
@@ -158,10 +158,14 @@ class DocAPIResponseBase(BaseModel):
     code: AppCode = Field(..., description="Application-specific code.")
     detail: str = Field(..., description="Human-readable message.")
 
+    # inclusive status range accepted by the envelope, narrowed by the 2xx/4xx/5xx subclasses
+    _STATUS_RANGE: ClassVar[Tuple[int, int]] = (100, 599)
+
     @field_validator("status")
     def check_valid_http_code(cls, v: int) -> int:
-        if not (100 <= v <= 599):
-            raise ValueError(f"Invalid HTTP status code: {v}")
+        low, high = cls._STATUS_RANGE
+        if not (low <= v <= high):
+            raise ValueError(f"{cls.__name__} requires status code in {low}-{high}, got {v}")
         return v
 
 
@@ -172,12 +176,7 @@ class DocAPIResponseOK(DocAPIResponseBase, Generic[T]):
         description="Optional data payload associated with the response."
     )
 
-    @model_validator(mode="after")
-    def _ensure_2xx(self):
-        code = int(self.status)
-        if not (200 <= code <= 299):
-            raise ValueError(f"DocAPIResponseOK requires 2xx status_code, got {code}")
-        return self
+    _STATUS_RANGE: ClassVar[Tuple[int, int]] = (200, 299)
 
 
 class DocAPIResponseClientError(DocAPIResponseBase):
@@ -186,12 +185,7 @@ class DocAPIResponseClientError(DocAPIResponseBase):
         None, description="Optional error details."
     )
 
-    @model_validator(mode="after")
-    def _ensure_4xx(self):
-        code = int(self.status)
-        if not (400 <= code <= 499):
-            raise ValueError(f"DocAPIResponseClientError requires 4xx status_code, got {code}")
-        return self
+    _STATUS_RANGE: ClassVar[Tuple[int, int]] = (400, 499)
 
 class DocAPIClientErrorException(Exception):
     def __init__(self, *, status: int, code: AppCode, detail: str, details: Optional[Any] = None, headers: Optional[Mapping[str, str]] = None):
@@ -209,15 +203,31 @@ class DocAPIResponseServerError(DocAPIResponseBase):
         None, description="Optional error details."
     )
 
-    @model_validator(mode="after")
-    def _ensure_5xx(self):
-        code = int(self.status)
-        if not (500 <= code <= 599):
-            raise ValueError(f"DocAPIResponseServerError requires 5xx status_code, got {code}")
-        return self
+    _STATUS_RANGE: ClassVar[Tuple[int, int]] = (500, 599)
+
+
+NO_BODY_STATUSES = frozenset((fastapi.status.HTTP_204_NO_CONTENT, fastapi.status.HTTP_205_RESET_CONTENT))
+
 
+class PydanticResponse(Response):
+    """JSON response rendered directly from a Pydantic model by its pydantic-core serializer."""
+    media_type = "application/json"
+
+    def __init__(self, content: BaseModel, status_code: int = 200, headers: Optional[Mapping[str, str]] = None,
+                 exclude_none: bool = False):
+        self.exclude_none = exclude_none
+        super().__init__(content=content, status_code=status_code, headers=headers)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content, exclude_none=self.exclude_none)
+
+
+def no_content_response(status: int = fastapi.status.HTTP_204_NO_CONTENT) -> Response:
+    """Empty 204/205 response, routes with nothing to return can skip building a DocAPIResponseOK."""
+    if status not in NO_BODY_STATUSES:
+        raise ValueError(f"No-content response requires 204 or 205 status_code, got {status}")
+    return Response(status_code=status)
 
-NO_BODY_STATUSES = {fastapi.status.HTTP_204_NO_CONTENT, fastapi.status.HTTP_205_RESET_CONTENT}
 
 def validate_ok_response(payload: DocAPIResponseOK[T], exclude_none: bool = False) -> Response:
     """
@@ -225,36 +235,33 @@ def validate_ok_response(payload: DocAPIResponseOK[T], exclude_none: bool = Fals
     directly from route and use FastAPI response_model for validation.
     Policy:
       - 204/205 => empty Response (no body) - RFC: 204/205 MUST NOT include a body.
-      - Other 2xx => DocAPIResponseOK[T] as JSONResponse
+      - Other 2xx => DocAPIResponseOK[T] as PydanticResponse
     """
     if payload.status in NO_BODY_STATUSES:
         return Response(status_code=payload.status)
 
-    return JSONResponse(status_code=payload.status, content=payload.model_dump(mode="json", exclude_none=exclude_none))
+    return PydanticResponse(content=payload, status_code=payload.status, exclude_none=exclude_none)
 
 
-def validate_client_error_response(payload: DocAPIResponseClientError, headers: Optional[Mapping[str, str]] = None) -> JSONResponse:
+def validate_client_error_response(payload: DocAPIResponseClientError, headers: Optional[Mapping[str, str]] = None) -> PydanticResponse:
     """Render a validated 4xx error."""
-    hdrs: Optional[dict[str, str]] = None
-    if headers:
-        filtered: dict[str, str] = {}
-        for k, v in headers.items():
-            if v is not None:  # skip None values
-                filtered[str(k)] = str(v)
-        hdrs = filtered or None
-
-    return JSONResponse(
-        status_code=int(payload.status),
-        content=payload.model_dump(mode="json", exclude_none=True),
-        headers=hdrs
+    # skip None values
+    hdrs = {str(k): str(v) for k, v in headers.items() if v is not None} if headers else None
+
+    return PydanticResponse(
+        content=payload,
+        status_code=payload.status,
+        headers=hdrs,
+        exclude_none=True
     )
 
 
-def validate_server_error_response(payload: DocAPIResponseServerError) -> JSONResponse:
+def validate_server_error_response(payload: DocAPIResponseServerError) -> PydanticResponse:
     """Render a validated 5xx error."""
-    return JSONResponse(
-        status_code=int(payload.status),
-        content=payload.model_dump(mode="json", exclude_none=True)
+    return PydanticResponse(
+        content=payload,
+        status_code=payload.status,
+        exclude_none=True
     )
 
 GENERAL_RESPONSES = {
@@ -296,6 +303,35 @@ GENERAL_RESPONSES = {
     }
 }
 
+_HTTP_STATUS_DESCRIPTIONS = MappingProxyType({
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    410: "Gone",
+    415: "Unsupported Media Type",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+})
+
+class _StatusEntry:
+    """make_responses accumulator for one status: examples per content type and the first JSON model."""
+    __slots__ = ("examples_by_ctype", "meta")
+
+    def __init__(self):
+        self.examples_by_ctype: Dict[str, Dict[Any, Any]] = {}
+        self.meta: Optional[_ModelMeta] = None
+
+
 def make_responses(spec: Dict[Any, Dict[str, Any]], inject_schema: bool = False) -> Dict[int, Dict[str, Any]]:
     """
     spec item format (one dict entry per AppCode):
@@ -315,9 +351,7 @@ def make_responses(spec: Dict[Any, Dict[str, Any]], inject_schema: bool = False)
         # "example_value": "(binary image data)",
       }
     """
-    grouped = defaultdict(lambda: defaultdict(lambda: {"examples": {}}))  # status -> ctype -> examples
-    status_models: Dict[int, Optional[Type[Any]]] = {}
-    status_schema_refs: Dict[int, str] = {}
+    grouped: Dict[int, _StatusEntry] = {}
 
     for app_code, cfg in spec.items():
         status: int = cfg["status"]
@@ -329,6 +363,10 @@ def make_responses(spec: Dict[Any, Dict[str, Any]], inject_schema: bool = False)
         details: Any = cfg.get("details")
         example_value = cfg.get("example_value")
 
+        status_entry = grouped.get(status)
+        if status_entry is None:
+            status_entry = grouped[status] = _StatusEntry()
+
         # Build example value
         if ctype != "application/json":
             if example_value is None:
@@ -346,89 +384,93 @@ def make_responses(spec: Dict[Any, Dict[str, Any]], inject_schema: bool = False)
                     detail=detail,
                     status=status,
                     details=details)
-                # Keep FastAPI "model" behavior for non-inject path
-                status_models.setdefault(status, get_origin(model_cls) or model_cls)
-                # Precompute the $ref we’ll inject when inject_schema=True
-                status_schema_refs.setdefault(status, _schema_ref_from_model(model_cls))
+                # first model of the status gives FastAPI "model" (non-inject path) and the injected $ref
+                if status_entry.meta is None:
+                    status_entry.meta = _model_meta(model_cls)
             else:
                 raise ValueError(f"JSON example needs 'model' for {app_code} (generic OK or non-generic).")
 
-        grouped[status][ctype]["examples"][app_code.value] = {
-            "summary": app_code.value,
+        # AppCode is a StrEnum, the member itself is the example key / summary text
+        examples = status_entry.examples_by_ctype.setdefault(ctype, {})
+        examples[app_code] = {
+            "summary": app_code,
             **({"description": desc} if desc else {}),
             "value": value,
         }
 
-    _HTTP_STATUS_DESCRIPTIONS = {
-        200: "OK",
-        201: "Created",
-        202: "Accepted",
-        204: "No Content",
-        400: "Bad Request",
-        401: "Unauthorized",
-        403: "Forbidden",
-        404: "Not Found",
-        405: "Method Not Allowed",
-        409: "Conflict",
-        410: "Gone",
-        415: "Unsupported Media Type",
-        422: "Unprocessable Entity",
-        429: "Too Many Requests",
-        500: "Internal Server Error",
-        502: "Bad Gateway",
-        503: "Service Unavailable",
-    }
+    status_description = _HTTP_STATUS_DESCRIPTIONS.get
 
     # Assemble FastAPI responses shape
     if not inject_schema:
         responses: Dict[int, Dict[str, Any]] = {}
-        for status, c_map in grouped.items():
+        for status, status_entry in grouped.items():
+            c_map = status_entry.examples_by_ctype
             entry: Dict[str, Any] = {
-                "description": _HTTP_STATUS_DESCRIPTIONS.get(status, f"Response status {status}."),
+                "description": status_description(status, f"Response status {status}."),
                 "content": {},
             }
 
-            if "application/json" in c_map and status in status_models and status_models[status] is not None:
-                entry["model"] = status_models[status]
+            if "application/json" in c_map and status_entry.meta is not None:
+                entry["model"] = status_entry.meta.origin
 
-            for ctype, payload in c_map.items():
-                entry["content"][ctype] = {"examples": payload["examples"]}
+            for ctype, examples in c_map.items():
+                entry["content"][ctype] = {"examples": examples}
 
             responses[status] = entry
     else:
         responses = {}
-        for status, c_map in grouped.items():
+        for status, status_entry in grouped.items():
             entry: Dict[str, Any] = {
-                "description": _HTTP_STATUS_DESCRIPTIONS.get(status, f"Response status {status}."),
+                "description": status_description(status, f"Response status {status}."),
                 "content": {},
             }
 
-            for ctype, payload in c_map.items():
-                content_obj: Dict[str, Any] = {"examples": payload["examples"]}
-                if ctype == "application/json":
-                    schema_ref = status_schema_refs.get(status)
-                    if schema_ref:
-                        content_obj["schema"] = {"$ref": schema_ref}
+            for ctype, examples in status_entry.examples_by_ctype.items():
+                content_obj: Dict[str, Any] = {"examples": examples}
+                if ctype == "application/json" and status_entry.meta is not None:
+                    content_obj["schema"] = {"$ref": status_entry.meta.schema_ref}
                 entry["content"][ctype] = content_obj
 
             responses[status] = entry
 
     return responses
 
+# (model_cls, model_data_cls, app_code, status, detail, repr(details)) -> rendered example
+_JSON_EXAMPLES: Dict[tuple, dict] = {}
+
 def _build_json_example(
     *, model_cls: Type[Any], model_data_cls: Optional[Type[Any]],
     app_code, detail: str, status: int, details: Any
 ) -> dict:
     """
-    Success (generic): instantiate model_cls(status, code, detail, data=model_example(T))
-    Error (non-generic): instantiate model_cls(status, code, detail, details=...)
+    Success (generic): {status, code, detail, data=model_example(T)}
+    Error (non-generic): {status, code, detail, details=...}
+    The envelope is built as a plain dict in model_cls's JSON shape, the values are static so it is not validated.
+
+    Examples are cached, specs shared between routes (GENERAL_RESPONSES, guards) are rendered once;
+    the returned dict is shared and must not be mutated.
     """
+    cache_key = (model_cls, model_data_cls, app_code, status, detail, repr(details))
+    example = _JSON_EXAMPLES.get(cache_key)
+    if example is not None:
+        return example
+
+    example = {"status": status, "code": app_code, "detail": detail}
     if model_data_cls is not None:
-        data = model_example(model_data_cls)
-        inst = model_cls(status=status, code=app_code, detail=detail, data=data)
-    else:
-        inst = model_cls(status=status, code=app_code, detail=detail, details=details)
-    return inst.model_dump(mode="json", exclude_none=True)
+        example["data"] = model_example(model_data_cls)
+    elif details is not None:
+        example["details"] = details
+    _JSON_EXAMPLES[cache_key] = example
+    return example
+
+class _ModelMeta(NamedTuple):
+    origin: Type[Any]
+    schema_ref: str
+
+@functools.lru_cache(maxsize=None)
+def _model_meta(model_tp: Type[Any]) -> _ModelMeta:
+    """Typing introspection of a response model, computed once per model type."""
+    return _ModelMeta(origin=get_origin(model_tp) or model_tp, schema_ref=_schema_ref_from_model(model_tp))
 
 def _schema_ref_from_model(model_tp: Type[Any]) -> str:
     """
@@ -437,4 +479,4 @@ def _schema_ref_from_model(model_tp: Type[Any]) -> str:
       - Error:    Origin             (e.g., DocAPIResponseClientError)
     """
     base = getattr(model_tp, "__name__", str(model_tp))
-    return f"#/components/schemas/{base}"
\ No newline at end of file
+    return sys.intern(f"#/components/schemas/{base}")
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import Dict, Optional
-from defusedxml import ElementTree as ET
+from typing import AbstractSet, Dict, Optional
+from xml.etree.ElementTree import Element
 
 ALLOWED_NS = {
     "http://www.loc.gov/standards/alto/ns-v2#",
@@ -7,16 +7,31 @@ ALLOWED_NS = {
     "http://www.loc.gov/standards/alto/ns-v4#",
 }
 
+# descendant element local name -> check it satisfies
+_ELEMENT_CHECKS = {
+    "Layout": "has_layout",
+    "Page": "has_page",
+    "String": "has_text",
+    "TextLine": "has_text",
+    "TextBlock": "has_text",
+}
+
 
 def _localname(tag: str) -> str:
-    return tag.split("}", 1)[1] if tag.startswith("{") else tag
+    ns_part, sep, name = tag.partition("}")
+    return name if sep else ns_part
 
 
 def _namespace(tag: str) -> Optional[str]:
-    return tag[1:].split("}", 1)[0] if tag.startswith("{") else None
+    return tag[1:tag.index("}")] if tag[:1] == "{" else None
 
 
-def validate_alto_basic(xml_bytes: bytes) -> Dict[str, bool]:
+def validate_alto_basic(root: Element, enabled: Optional[AbstractSet[str]] = None) -> Dict[str, bool]:
+    """
+    Basic structural checks of a parsed document (see xml_validator.parse_xml).
+    If `enabled` is given (config.ALTO_VALIDATION), descendant elements are only searched
+    for the checks named in it, the others are reported False.
+    """
     checks = {
         "root": False,
         "namespace": False,
@@ -25,8 +40,6 @@ def validate_alto_basic(xml_bytes: bytes) -> Dict[str, bool]:
         "has_text": False,
     }
 
-    root = ET.fromstring(xml_bytes)
-
     if _localname(root.tag) == "alto":
         checks["root"] = True
 
@@ -34,17 +47,17 @@ def validate_alto_basic(xml_bytes: bytes) -> Dict[str, bool]:
     if ns in ALLOWED_NS:
         checks["namespace"] = True
 
-    if root.find(".//{*}Layout") is not None:
-        checks["has_layout"] = True
-
-    if root.find(".//{*}Page") is not None:
-        checks["has_page"] = True
-
-    if (
-        root.find(".//{*}String") is not None
-        or root.find(".//{*}TextLine") is not None
-        or root.find(".//{*}TextBlock") is not None
-    ):
-        checks["has_text"] = True
+    # single walk over the descendants instead of one find() per element name
+    pending = {check for check in _ELEMENT_CHECKS.values() if enabled is None or check in enabled}
+    if pending:
+        for el in root.iter():
+            if el is root:
+                continue
+            check = _ELEMENT_CHECKS.get(_localname(el.tag))
+            if check in pending:
+                checks[check] = True
+                pending.discard(check)
+                if not pending:
+                    break
 
     return checks
@@ -1,23 +1,30 @@
-from typing import Dict, Optional
-from defusedxml import ElementTree as ET
+from typing import AbstractSet, Dict, Optional
+from xml.etree.ElementTree import Element
 
 PAGE_NS_BASE = "http://schema.primaresearch.org/PAGE/gts/pagecontent/"
 
+# descendant element local name -> check it satisfies
+_ELEMENT_CHECKS = {
+    "Page": "has_page",
+    "TextRegion": "has_text",
+    "TextLine": "has_text",
+}
+
 def _localname(tag: str) -> str:
-    return tag.split("}", 1)[1] if tag.startswith("{") else tag
+    ns_part, sep, name = tag.partition("}")
+    return name if sep else ns_part
 
 def _namespace(tag: str) -> Optional[str]:
-    return tag[1:].split("}", 1)[0] if tag.startswith("{") else None
-
-def validate_page_basic(xml_bytes: bytes) -> Dict[str, bool]:
+    return tag[1:tag.index("}")] if tag[:1] == "{" else None
+
+def validate_page_basic(root: Element, enabled: Optional[AbstractSet[str]] = None) -> Dict[str, bool]:
+    """
+    Basic structural checks of a parsed document (see xml_validator.parse_xml).
+    If `enabled` is given (config.PAGE_VALIDATION), descendant elements are only searched
+    for the checks named in it, the others are reported False.
+    """
     checks = {"root": False, "namespace": False, "has_page": False, "has_text": False}
 
-    try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
-        # not even XML
-        return checks
-
     # Root element must be PcGts
     if _localname(root.tag) == "PcGts":
         checks["root"] = True
@@ -27,13 +34,17 @@ def validate_page_basic(xml_bytes: bytes) -> Dict[str, bool]:
     if ns is None or ns.startswith(PAGE_NS_BASE):
         checks["namespace"] = True
 
-    # Require at least one <Page>
-    page = root.find(".//{*}Page")
-    if page is not None:
-        checks["has_page"] = True
-
-    # Presence of text-bearing structures anywhere
-    if root.find(".//{*}TextRegion") is not None or root.find(".//{*}TextLine") is not None:
-        checks["has_text"] = True
+    # Require at least one <Page> and presence of text-bearing structures anywhere, in a single walk
+    pending = {check for check in _ELEMENT_CHECKS.values() if enabled is None or check in enabled}
+    if pending:
+        for el in root.iter():
+            if el is root:
+                continue
+            check = _ELEMENT_CHECKS.get(_localname(el.tag))
+            if check in pending:
+                checks[check] = True
+                pending.discard(check)
+                if not pending:
+                    break
 
     return checks
@@ -1,13 +1,15 @@
+from typing import Optional
+from xml.etree.ElementTree import Element
+
 from defusedxml import ElementTree as ET
 from defusedxml.common import DefusedXmlException
 
-def is_well_formed_xml(xml_bytes: bytes) -> bool:
+def parse_xml(xml_bytes: bytes) -> Optional[Element]:
     """
-    Returns True if the given bytes represent well-formed XML.
+    Returns the root element of the given bytes, or None if they are not well-formed XML.
     Uses defusedxml for safe parsing.
     """
     try:
-        ET.fromstring(xml_bytes)
-        return True
+        return ET.fromstring(xml_bytes)
     except (ET.ParseError, DefusedXmlException):
-        return False
\ No newline at end of file
+        return None
@@ -6,13 +6,15 @@ import socket
 
 class DocAPIFormatter(logging.Formatter):
     converter = time.gmtime
+    # resolved once per process instead of a gethostname() syscall per record
+    hostname = socket.gethostname()
 
     def format(self, record: logging.LogRecord) -> str:
-        record.hostname = socket.gethostname()
+        record.hostname = self.hostname
         return super().format(record)
 
 
-TRUE_VALUES = {"true", "1"}
+TRUE_VALUES = frozenset({"true", "1"})
 
 
 class Config:
@@ -20,6 +22,8 @@ class Config:
         self.APP_HOST = os.getenv("APP_HOST", "0.0.0.0")
         self.APP_PORT = int(os.getenv("APP_PORT", "9999"))
         self.PRODUCTION = self._env_bool("PRODUCTION", False)
+        # number of uvicorn worker processes in production, 0 = 2 * CPU cores + 1 (ignored when not PRODUCTION)
+        self.APP_WORKERS = int(os.getenv("APP_WORKERS", "1"))
 
         # if the app is hosted ${APP_BASE_URL}/subpath, set this to "/subpath"
         self.APP_URL_ROOT = os.getenv("APP_URL_ROOT", "")
@@ -61,6 +65,8 @@ class Config:
         self.DATABASE_ALLOW_UPDATE = self._env_bool("DATABASE_ALLOW_UPDATE", False)
         # if True, skip creating DB and alembic upgrade, simply assume the DB is ready
         self.DATABASE_FORCE = self._env_bool("DATABASE_FORCE", False)
+        # number of DB connections opened at app startup so the first requests do not pay the connect cost, 0 = disabled
+        self.DATABASE_POOL_WARM_SIZE = int(os.getenv("DATABASE_POOL_WARM_SIZE", "5"))
 
         # job processing configuration
         ################################################################################################################
@@ -75,25 +81,25 @@ class Config:
 
         # validate uploaded files configuration (valid XML and IMAGE decodable by OpenCV is always checked)
         ################################################################################################################
-        # Per-check toggles for ALTO & PAGE XML validation (all default to False)
+        # Per-check toggles for ALTO & PAGE XML validation (all default to False), kept as the set of enabled checks
         # Enable by setting env vars to one of TRUE_VALUES: {"true", "1"} (case-insensitive).
         self.RESULT_ZIP_VALIDATION = self._env_bool("RESULT_ZIP_VALIDATION", True)
         self.ARTIFACTS_ZIP_VALIDATION = self._env_bool("ARTIFACTS_ZIP_VALIDATION", True)
         self.ENGINE_FILES_ZIP_VALIDATION = self._env_bool("ENGINE_FILES_ZIP_VALIDATION", True)
-        self.ALTO_VALIDATION = {
+        self.ALTO_VALIDATION = frozenset(check for check, enabled in {
             "root": self._env_bool("ALTO_VALIDATE_ROOT", True),
             "namespace": self._env_bool("ALTO_VALIDATE_NAMESPACE", False),
             "has_layout": self._env_bool("ALTO_VALIDATE_HAS_LAYOUT", False),
             "has_page": self._env_bool("ALTO_VALIDATE_HAS_PAGE", False),
             "has_text": self._env_bool("ALTO_VALIDATE_HAS_TEXT", False),
-        }
+        }.items() if enabled)
 
-        self.PAGE_VALIDATION = {
+        self.PAGE_VALIDATION = frozenset(check for check, enabled in {
             "root": self._env_bool("PAGE_VALIDATE_ROOT", True),
             "namespace": self._env_bool("PAGE_VALIDATE_NAMESPACE", False),
             "has_page": self._env_bool("PAGE_VALIDATE_HAS_PAGE", False),
             "has_text": self._env_bool("PAGE_VALIDATE_HAS_TEXT", False),
-        }
+        }.items() if enabled)
 
         # EMAILS and NOTIFICATIONS configuration
         ################################################################################################################
@@ -171,13 +177,16 @@ class Config:
 
         # API documentation configuration
         ################################################################################################################
-        self.SHOW_SECTIONS = set([x.strip() for x in os.getenv("SHOW_SECTIONS", "User, Worker, Admin").split(',')])
+        self.SHOW_SECTIONS = frozenset(x.strip() for x in os.getenv("SHOW_SECTIONS", "User, Worker, Admin").split(','))
 
         self.SHOW_PUT_IMAGE = self._env_bool("SHOW_PUT_IMAGE", True)
         self.SHOW_PUT_ALTO = self._env_bool("SHOW_PUT_ALTO", True)
         self.SHOW_PUT_PAGE = self._env_bool("SHOW_PUT_PAGE", True)
         self.SHOW_PUT_METADATA = self._env_bool("SHOW_PUT_METADATA", True)
 
+        # if False, descriptions and examples of schema fields are not kept (smaller schemas, bare /docs)
+        self.FIELD_WITH_DOCS = self._env_bool("FIELD_WITH_DOCS", True)
+
 
         # Job definition examples for documentation (validation is strictly for JobDefinition schema)
         self.JOB_DEFINITION_SUMMARY = os.getenv("JOB_DEFINITION_SUMMARY", "Create Job")
@@ -189,40 +198,42 @@ class Config:
                                                     "The images must have specified extensions (e.g., `.jpg`, `.png`) in their names.\n\n"
                                                     "Do not use `alto_required` together with `page_required`, unless your processing worker supports both formats.\n\n"
                                                     "Optionally, you can specify `engine_name` to select a specific processing engine. Default engine will be used if not specified.\n\n")
-        self.JOB_DEFINITION_EXAMPLES = json.loads(os.getenv("JOB_DEFINITION_EXAMPLES",
-                                                            json.dumps({
-                                                                "IMAGE job": {
-                                                                    "summary": "Default",
-                                                                    "description": "Simple job with two images.",
-                                                                    "value": {
-                                                                        "images": [
-                                                                            {
-                                                                                "name": "image0.jpg",
-                                                                                "order": 0
-                                                                            },
-                                                                            {
-                                                                                "name": "image1.jpg",
-                                                                                "order": 1
-                                                                            }
-                                                                        ],
-                                                                        "meta_json_required": False,
-                                                                        "alto_required": False,
-                                                                        "page_required": False,
-                                                                        "engine_name": "Engine A",
-                                                                    }}})))
+        job_definition_examples = os.getenv("JOB_DEFINITION_EXAMPLES")
+        self.JOB_DEFINITION_EXAMPLES = json.loads(job_definition_examples) if job_definition_examples is not None else {
+            "IMAGE job": {
+                "summary": "Default",
+                "description": "Simple job with two images.",
+                "value": {
+                    "images": [
+                        {
+                            "name": "image0.jpg",
+                            "order": 0
+                        },
+                        {
+                            "name": "image1.jpg",
+                            "order": 1
+                        }
+                    ],
+                    "meta_json_required": False,
+                    "alto_required": False,
+                    "page_required": False,
+                    "engine_name": "Engine A",
+                },
+            },
+        }
 
         # Meta JSON upload examples for documentation (validation is done only for valid JSON structure, not content)
         self.META_JSON_SUMMARY = os.getenv("META_JSON_SUMMARY", "Upload Meta JSON")
         self.META_JSON_DESCRIPTION = os.getenv("META_JSON_DESCRIPTION",
                                                "Upload the Meta JSON file for a job.")
-        self.META_JSON_EXAMPLES = json.loads(os.getenv("META_JSON_EXAMPLES",
-                                                       json.dumps({
-                                                           "object": {"summary": "JSON object",
-                                                                      "value": {"engine": "ocr", "version": 2}},
-                                                           "array": {"summary": "JSON array",
-                                                                     "value": ["step1", "step2", "step3"]},
-                                                           "primitive": {"summary": "Primitive value", "value": True},
-                                                       })))
+        meta_json_examples = os.getenv("META_JSON_EXAMPLES")
+        self.META_JSON_EXAMPLES = json.loads(meta_json_examples) if meta_json_examples is not None else {
+            "object": {"summary": "JSON object",
+                       "value": {"engine": "ocr", "version": 2}},
+            "array": {"summary": "JSON array",
+                      "value": ["step1", "step2", "step3"]},
+            "primitive": {"summary": "Primitive value", "value": True},
+        }
 
         # Result download examples for documentation
         self.RESULT_SUMMARY = os.getenv("RESULT_SUMMARY", "Download Result")
@@ -247,8 +258,9 @@ class Config:
 
         self.TEST_HTTP_TIMEOUT = os.getenv("TEST_HTTP_TIMEOUT", "30")
 
-    def _env_bool(self, key: str, default: bool = False) -> bool:
-        val = os.getenv(key)
+    @staticmethod
+    def _env_bool(key: str, default: bool = False) -> bool:
+        val = os.environ.get(key)
         if val is None:
             return default
         return val.strip().lower() in TRUE_VALUES
@@ -26,7 +26,8 @@ def main():
         handlers=[logging.StreamHandler(sys.stdout)],
     )
 
-    logger.info(' '.join(sys.argv))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(' '.join(sys.argv))
 
     asyncio.run(create_database_if_does_not_exist())
 
@@ -52,9 +53,9 @@ async def create_database_if_does_not_exist():
                 # Quote the identifier safely (double any double-quotes)
                 safe = db_name.replace('"', '""')
                 await conn.execute(text(f'CREATE DATABASE "{safe}"'))
-                logger.info(f"Database '{db_name}' created.")
+                logger.info("Database '%s' created.", db_name)
             else:
-                logger.info(f"Database '{db_name}' exists.")
+                logger.info("Database '%s' exists.", db_name)
     finally:
         # Ensure everything is torn down before the loop ends
         await engine.dispose()
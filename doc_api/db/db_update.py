@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 from pathlib import Path
 from typing import Optional, Tuple
@@ -29,8 +30,8 @@ def init_and_update_db():
     elif state == "versioned":
         latest_revision = get_latest_alembic_revision()
         if alembic_version != latest_revision:
-            logger.info(
-                f"Database schema is out of date -> current version: {alembic_version}, latest version: {latest_revision}.")
+            logger.info("Database schema is out of date -> current version: %s, latest version: %s.",
+                        alembic_version, latest_revision)
             if config.DATABASE_ALLOW_UPDATE and alembic_version != latest_revision:
                 logger.info("Running alembic upgrade to update schema.")
                 run_alembic_upgrade(config.DATABASE_URL)
@@ -43,40 +44,36 @@ def init_and_update_db():
 
 async def get_db_state() -> Tuple[str, Optional[str]]:
     engine = create_async_engine(config.DATABASE_URL, poolclass=NullPool)
-    async with engine.connect() as conn:
-        rows = (await conn.execute(text("""
-                        SELECT tablename
-                        FROM pg_catalog.pg_tables
-                        WHERE schemaname = 'public'
-                        ORDER BY tablename
-                    """))).fetchall()
-        tables = [r[0] for r in rows]
-        if len(tables) == 0:
-            await engine.dispose()
-            return "empty", None
-
-        # does alembic_version exist?
-        alembic_tbl_exists = (
-            await conn.execute(text("""
-                SELECT EXISTS (
-                  SELECT 1 FROM information_schema.tables
-                  WHERE table_schema = 'public' AND table_name = 'alembic_version'
-                )
-            """))
-        ).scalar_one()
-
-        if not alembic_tbl_exists:
-            await engine.dispose()
-            return "no_alembic_table", None
-
-        # read version number
-        row = (await conn.execute(text("SELECT version_num FROM alembic_version"))).first()
+    try:
+        async with engine.connect() as conn:
+            # are there any tables, and does alembic_version exist? (one round-trip)
+            has_tables, alembic_tbl_exists = (await conn.execute(text("""
+                SELECT
+                  EXISTS (
+                    SELECT 1 FROM pg_catalog.pg_tables
+                    WHERE schemaname = 'public'
+                  ),
+                  EXISTS (
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_schema = 'public' AND table_name = 'alembic_version'
+                  )
+            """))).one()
+
+            if not has_tables:
+                return "empty", None
+
+            if not alembic_tbl_exists:
+                return "no_alembic_table", None
+
+            # read version number
+            row = (await conn.execute(text("SELECT version_num FROM alembic_version"))).first()
+    finally:
         await engine.dispose()
 
-        if row and row[0]:
-            return "versioned", row[0]
-        else:
-            return "no_alembic_version", None
+    if row and row[0]:
+        return "versioned", row[0]
+    else:
+        return "no_alembic_version", None
 
 
 def run_alembic_upgrade(db_url: str):
@@ -85,7 +82,9 @@ def run_alembic_upgrade(db_url: str):
     command.upgrade(cfg, "head")
 
 
+@functools.cache
 def get_latest_alembic_revision() -> str:
+    # the migration scripts do not change while the process runs, scan them once
     script = ScriptDirectory.from_config(get_alembic_cfg())
     return script.get_current_head()
 
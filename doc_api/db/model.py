@@ -1,8 +1,10 @@
-from typing import Dict, Any
+import functools
+import operator
+from typing import Any, Callable, Dict, Tuple
 
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase
-from sqlalchemy import ForeignKey, DateTime, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, DateTime, Text, UniqueConstraint, Index
 from sqlalchemy.types import String
 
 from datetime import datetime, timezone
@@ -11,13 +13,34 @@ import uuid
 from doc_api.api.schemas.base_objects import ProcessingState
 from doc_api.api.schemas.base_objects import KeyRole
 
+# column names and a getter returning their values as a tuple, built once per ORM class
+@functools.cache
+def _column_getter(cls) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    names = tuple(c.name for c in cls.__table__.columns)
+    getter = operator.attrgetter(*names)
+    if len(names) == 1:
+        return names, lambda r: (getter(r),)
+    return names, getter
+
 # converts ORM row object to dict
-orm2dict = lambda r: {c.name: getattr(r, c.name) for c in r.__table__.columns}
+def orm2dict(r) -> Dict[str, Any]:
+    names, getter = _column_getter(type(r))
+    return dict(zip(names, getter(r)))
 
 # converts CORE row object to dict
 row2dict = lambda r: dict(r._mapping)
 
 
+# column defaults
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _same_as_created_date(context) -> datetime:
+    # a new row starts with last_change == created_date; the parameter may be absent
+    # (e.g. Core multi-row VALUES inserts), then fall back to the clock
+    return context.get_current_parameters().get("created_date") or _utc_now()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -25,24 +48,24 @@ class Base(DeclarativeBase):
 class Job(Base):
     __tablename__ = 'jobs'
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    owner_key_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('keys.id'), index=True, nullable=False)
+    owner_key_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('keys.id'), nullable=False)
     worker_key_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('keys.id'), index=True, nullable=True)
     engine_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('engines.id'), index=True, nullable=True)
 
     definition: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
 
-    alto_required: Mapped[bool] = mapped_column(index=True, default=False, nullable=False)
-    page_required: Mapped[bool] = mapped_column(index=True, default=False, nullable=False)
-    meta_json_required: Mapped[bool] = mapped_column(index=True, default=False, nullable=False)
-    meta_json_uploaded: Mapped[bool] = mapped_column(index=True, default=False, nullable=False)
+    alto_required: Mapped[bool] = mapped_column(default=False, nullable=False)
+    page_required: Mapped[bool] = mapped_column(default=False, nullable=False)
+    meta_json_required: Mapped[bool] = mapped_column(default=False, nullable=False)
+    meta_json_uploaded: Mapped[bool] = mapped_column(default=False, nullable=False)
 
-    state: Mapped[ProcessingState] = mapped_column(index=True, default=ProcessingState.NEW, nullable=False)
-    progress: Mapped[float] = mapped_column(index=True, default=0.0, nullable=False)
+    state: Mapped[ProcessingState] = mapped_column(default=ProcessingState.NEW, nullable=False)
+    progress: Mapped[float] = mapped_column(default=0.0, nullable=False)
     previous_attempts: Mapped[int] = mapped_column(index=True, nullable=True)
 
-    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True, nullable=False)
+    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utc_now, index=True, nullable=False)
     started_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=True)
-    last_change: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True, nullable=False)
+    last_change: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_same_as_created_date, index=True, nullable=False)
     finished_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=True)
 
     log: Mapped[str] = mapped_column(nullable=True)
@@ -50,6 +73,14 @@ class Job(Base):
 
     images: Mapped[list['Image']] = relationship(back_populates="job", foreign_keys='Image.job_id')
 
+    __table_args__ = (
+        # lease queue (QUEUED ordered by created_date) and timeout sweep (PROCESSING with old last_change)
+        Index('ix_jobs_state_created_date', 'state', 'created_date'),
+        Index('ix_jobs_state_last_change', 'state', 'last_change'),
+        # job listing of a key, optionally filtered by state
+        Index('ix_jobs_owner_key_id_state', 'owner_key_id', 'state'),
+    )
+
 
 class Image(Base):
     __tablename__ = 'images'
@@ -80,7 +111,7 @@ class Key(Base):
 
     active: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
 
-    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utc_now, nullable=False, index=True)
     last_used: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
 
 
@@ -98,7 +129,7 @@ class Engine(Base):
     default: Mapped[bool] = mapped_column(default=False, nullable=False, index=True)
     active: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
 
-    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utc_now, nullable=False, index=True)
     last_used: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
     files_updated: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
 
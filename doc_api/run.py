@@ -10,23 +10,39 @@ if __name__ == "__main__":
     logger = logging.getLogger(__name__)
 
     import asyncio
+    import os
     import uvicorn
 
     from doc_api.db.db_create import create_database_if_does_not_exist
     from doc_api.db.db_update import init_and_update_db
 
+    async def bootstrap():
+        await create_database_if_does_not_exist()
+        # init_and_update_db (and alembic) run their own event loop, keep them off this one
+        await asyncio.to_thread(init_and_update_db)
+
     if not config.DATABASE_FORCE:
-        asyncio.run(create_database_if_does_not_exist())
-        init_and_update_db()
+        asyncio.run(bootstrap())
     else:
         logger.warning("Skipping creating DB and alembic upgrade due to DB_FORCE=True. "
                        "Assuming the database exist and the schema is up to date.")
 
 
-    logger.info(f"Running DocAPI on {config.APP_HOST}:{config.APP_PORT} (production={config.PRODUCTION})")
+    # reload and workers are mutually exclusive, so workers are used only in production
+    if config.PRODUCTION:
+        workers = config.APP_WORKERS or (os.cpu_count() or 1) * 2 + 1
+    else:
+        workers = None
+
+    # logging is already configured in this process, only spawned reload/worker subprocesses need uvicorn to apply it
+    log_config = config.LOGGING_CONFIG if not config.PRODUCTION or workers > 1 else None
+
+    logger.info("Running DocAPI on %s:%s (production=%s, workers=%s)",
+                config.APP_HOST, config.APP_PORT, config.PRODUCTION, workers or 1)
 
     uvicorn.run("api.main:app",
                 host=config.APP_HOST,
                 port=config.APP_PORT,
                 reload=not config.PRODUCTION,
-                log_config=config.LOGGING_CONFIG)
+                workers=workers,
+                log_config=log_config)
@@ -1,10 +1,10 @@
 import os
 import asyncio
+from types import MappingProxyType
 from typing import Optional
 
 import httpx
 
-import io
 import os.path
 import urllib.parse
 
@@ -49,16 +49,6 @@ def _opts(request):
     }
 
 
-# -----------------------------------------------------------------------------
-# Single event loop for the entire test session
-# -----------------------------------------------------------------------------
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 # -----------------------------------------------------------------------------
 # Validate required APP_BASE_URL once per session
 # -----------------------------------------------------------------------------
@@ -73,9 +63,10 @@ def _require_base_url(_opts):
 
 
 # -----------------------------------------------------------------------------
-# httpx client pointed at the running instance
+# httpx client pointed at the running instance, shared by the whole session
+# so keep-alive connections are reused across tests
 # -----------------------------------------------------------------------------
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope="session")
 async def client(_opts):
     timeout = httpx.Timeout(_opts["TEST_HTTP_TIMEOUT"])
     async with httpx.AsyncClient(base_url=_opts["APP_BASE_URL"], timeout=timeout, follow_redirects=True) as ac:
@@ -83,7 +74,7 @@ async def client(_opts):
 
 
 # -----------------------------------------------------------------------------
-# Header fixtures (skip tests if a needed key isn't supplied)
+# Header fixtures (skip tests if a needed key isn't supplied), shared read-only for the session
 # -----------------------------------------------------------------------------
 def _headers_or_skip(key: Optional[str], which: str):
     if not key:
@@ -91,21 +82,21 @@ def _headers_or_skip(key: Optional[str], which: str):
             f"{which} API key not provided for remote target. "
             f"Pass --api-key-{which.lower()} or set TEST_{which.upper()}_KEY."
         )
-    return {"X-API-Key": key}
+    return MappingProxyType({"X-API-Key": key})
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def readonly_headers(_opts):
     return _headers_or_skip(_opts["TEST_READONLY_KEY"], "READONLY")
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def user_headers(_opts):
     return _headers_or_skip(_opts["TEST_USER_KEY"], "USER")
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def worker_headers(_opts):
     return _headers_or_skip(_opts["TEST_WORKER_KEY"], "WORKER")
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def admin_headers(_opts):
     return _headers_or_skip(_opts["TEST_ADMIN_KEY"], "ADMIN")
 
@@ -160,7 +151,7 @@ async def cancelled_new_job(client, user_headers, created_job):
 
 
 async def _put_file(client, url: str, field: str, filename: str, data: bytes, content_type: str, headers):
-    files = {field: (filename, io.BytesIO(data), content_type)}
+    files = {field: (filename, data, content_type)}
     r = await client.put(url, files=files, headers=headers)
     return r
 
@@ -180,6 +171,10 @@ async def job_with_uploaded_engine_with_required_uploads_by_payload_name(client,
     return await _job_with_required_uploads_by_payload_name(client, user_headers, created_job_with_uploaded_engine)
 
 
+# cap on concurrent image uploads per job in the upload fixtures
+MAX_CONCURRENT_UPLOADS = 4
+
+
 async def _job_with_required_uploads_by_payload_name(client, user_headers, created_job):
     job = created_job["created_job"]
     payload = created_job["payload"]
@@ -199,14 +194,16 @@ async def _job_with_required_uploads_by_payload_name(client, user_headers, creat
         )
         assert r.status_code == 200, r.text
 
-    for i, pimg in enumerate(payload["images"]):
+    async def upload_image_files(pimg, reupload: bool):
         name = pimg["name"]
-        enc = _ename(name)
+        stem, ext = os.path.splitext(name)
+        files_url = f"/v1/jobs/{job_id}/images/{_ename(name)}/files"
+        xml_name = f"{stem}.xml"
 
-        img_bytes, ctype = make_white_image_bytes(os.path.splitext(name)[1])
+        img_bytes, ctype = make_white_image_bytes(ext)
         r = await _put_file(
             client,
-            f"/v1/jobs/{job_id}/images/{enc}/files/image",
+            f"{files_url}/image",
             "file",
             name,
             img_bytes,
@@ -214,10 +211,10 @@ async def _job_with_required_uploads_by_payload_name(client, user_headers, creat
             user_headers,
         )
         assert r.status_code == 201, r.text
-        if i < len(payload["images"]) - 1:
+        if reupload:
             r = await _put_file(
                 client,
-                f"/v1/jobs/{job_id}/images/{enc}/files/image",
+                f"{files_url}/image",
                 "file",
                 name,
                 img_bytes,
@@ -229,20 +226,20 @@ async def _job_with_required_uploads_by_payload_name(client, user_headers, creat
         if payload["alto_required"]:
             r = await _put_file(
                 client,
-                f"/v1/jobs/{job_id}/images/{enc}/files/alto",
+                f"{files_url}/alto",
                 "file",
-                f"{name.rsplit('.', 1)[0]}.xml",
+                xml_name,
                 VALID_ALTO_XML,
                 "application/xml",
                 user_headers,
             )
             assert r.status_code == 201, r.text
-            if i < len(payload["images"]) - 1:
+            if reupload:
                 r = await _put_file(
                     client,
-                    f"/v1/jobs/{job_id}/images/{enc}/files/alto",
+                    f"{files_url}/alto",
                     "file",
-                    f"{name.rsplit('.', 1)[0]}.xml",
+                    xml_name,
                     VALID_ALTO_XML,
                     "application/xml",
                     user_headers,
@@ -252,26 +249,42 @@ async def _job_with_required_uploads_by_payload_name(client, user_headers, creat
         if payload["page_required"]:
             r = await _put_file(
                 client,
-                f"/v1/jobs/{job_id}/images/{enc}/files/page",
+                f"{files_url}/page",
                 "file",
-                f"{name.rsplit('.', 1)[0]}.xml",
+                xml_name,
                 VALID_PAGE_XML,
                 "application/xml",
                 user_headers,
             )
             assert r.status_code == 201, r.text
-            if i < len(payload["images"]) - 1:
+            if reupload:
                 r = await _put_file(
                     client,
-                    f"/v1/jobs/{job_id}/images/{enc}/files/page",
+                    f"{files_url}/page",
                     "file",
-                    f"{name.rsplit('.', 1)[0]}.xml",
+                    xml_name,
                     VALID_PAGE_XML,
                     "application/xml",
                     user_headers,
                 )
                 assert r.status_code == 200, r.text
 
+    # Every image except the last one is uploaded twice (201, then 200 on overwrite) and these
+    # run concurrently, at most MAX_CONCURRENT_UPLOADS at a time. They write different image rows
+    # and cannot move the job out of NEW, because the last image's files are still missing.
+    # The last image is uploaded only after all of them have finished, so the job-state change
+    # (start_job, a conditional UPDATE on state NEW) always happens in that final upload, after
+    # every other file is committed.
+    upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+    async def upload_and_reupload(pimg):
+        async with upload_slots:
+            await upload_image_files(pimg, True)
+
+    images = payload["images"]
+    await asyncio.gather(*(upload_and_reupload(pimg) for pimg in images[:-1]))
+    await upload_image_files(images[-1], False)
+
     return created_job
 
 
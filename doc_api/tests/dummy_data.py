@@ -1,3 +1,4 @@
+import functools
 import itertools
 
 import cv2
@@ -41,10 +42,12 @@ def job_definition_payload_id(payload, app_code=None):
 
 JOB_DEFINITION_PAYLOADS = generate_job_definition_payloads()
 
+@functools.lru_cache(maxsize=None)
 def make_white_image_bytes(ext: str = ".jpg"):
     """
     Create a 1×1 pixel valid image using OpenCV and return (bytes, content_type).
     ext can be '.jpg', '.png', or '.tif' depending on what you want to test.
+    The result is immutable and cached per extension, so each format is encoded once per session.
     """
     # Create a simple white 1×1 RGB image
     img = np.full((128, 128, 3), 255, dtype=np.uint8)
@@ -9,55 +9,25 @@ from doc_api.config import config
 # GET /v1/me - 200, 401, 403
 #
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_VALID}:{base_objects.KeyRole.READONLY.name}"])
-async def test_get_me_200_readonly(client, readonly_headers, dummy):
-    r = await client.get("/v1/me", headers=readonly_headers)
-    assert r.status_code == 200, r.text
-    body = r.json()
-    assert body["code"] == AppCode.API_KEY_VALID.value
-    data = body["data"]
-    assert data["role"] == base_objects.KeyRole.READONLY.value
-    assert data["label"] == config.TEST_READONLY_KEY_LABEL
-    assert data["active"] is True
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_VALID}:{base_objects.KeyRole.USER.name}"])
-async def test_get_me_200_user(client, user_headers, dummy):
-    r = await client.get("/v1/me", headers=user_headers)
-    assert r.status_code == 200, r.text
-    body = r.json()
-    assert body["code"] == AppCode.API_KEY_VALID.value
-    data = body["data"]
-    assert data["role"] == base_objects.KeyRole.USER.value
-    assert data["label"] == config.TEST_USER_KEY_LABEL
-    assert data["active"] is True
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_VALID}:{base_objects.KeyRole.WORKER.name}"])
-async def test_get_me_200_worker(client, worker_headers, dummy):
-    r = await client.get("/v1/me", headers=worker_headers)
-    assert r.status_code == 200, r.text
-    body = r.json()
-    assert body["code"] == AppCode.API_KEY_VALID.value
-    data = body["data"]
-    assert data["role"] == base_objects.KeyRole.WORKER.value
-    assert data["label"] == config.TEST_WORKER_KEY_LABEL
-    assert data["active"] is True
+TEST_KEYS = [
+    (base_objects.KeyRole.READONLY, "readonly_headers", config.TEST_READONLY_KEY_LABEL),
+    (base_objects.KeyRole.USER, "user_headers", config.TEST_USER_KEY_LABEL),
+    (base_objects.KeyRole.WORKER, "worker_headers", config.TEST_WORKER_KEY_LABEL),
+    (base_objects.KeyRole.ADMIN, "admin_headers", config.TEST_ADMIN_KEY_LABEL),
+]
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_VALID}:{base_objects.KeyRole.ADMIN.name}"])
-async def test_get_me_200_admin(client, admin_headers, dummy):
-    r = await client.get("/v1/me", headers=admin_headers)
+@pytest.mark.parametrize("role, headers_fixture, label", TEST_KEYS, ids=[f"{AppCode.API_KEY_VALID}:{x[0].name}" for x in TEST_KEYS])
+async def test_get_me_200(client, request, role, headers_fixture, label):
+    headers = request.getfixturevalue(headers_fixture)
+    r = await client.get("/v1/me", headers=headers)
     assert r.status_code == 200, r.text
     body = r.json()
     assert body["code"] == AppCode.API_KEY_VALID.value
     data = body["data"]
-    assert data["role"] == base_objects.KeyRole.ADMIN.value
-    assert data["label"] == config.TEST_ADMIN_KEY_LABEL
+    assert data["role"] == role.value
+    assert data["label"] == label
     assert data["active"] is True
 
 
@@ -93,27 +63,11 @@ async def test_get_me_403_inactive(client, admin_headers, inactive_key):
 #
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_ROLE_FORBIDDEN}:{base_objects.KeyRole.READONLY.name}"])
-async def test_get_admin_keys_403_readonly(client, readonly_headers, dummy):
-    r = await client.get("/v1/admin/keys", headers=readonly_headers)
-    assert r.status_code == 403, r.text
-    body = r.json()
-    assert body["code"] == AppCode.API_KEY_ROLE_FORBIDDEN.value
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_ROLE_FORBIDDEN}:{base_objects.KeyRole.USER.name}"])
-async def test_get_admin_keys_403_user(client, user_headers, dummy):
-    r = await client.get("/v1/admin/keys", headers=user_headers)
-    assert r.status_code == 403, r.text
-    body = r.json()
-    assert body["code"] == AppCode.API_KEY_ROLE_FORBIDDEN.value
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("dummy", [0], ids=[f"{AppCode.API_KEY_ROLE_FORBIDDEN}:{base_objects.KeyRole.WORKER.name}"])
-async def test_get_admin_keys_403_worker(client, worker_headers, dummy):
-    r = await client.get("/v1/admin/keys", headers=worker_headers)
+@pytest.mark.parametrize("headers_fixture", [x[1] for x in TEST_KEYS if x[0] != base_objects.KeyRole.ADMIN],
+                         ids=[f"{AppCode.API_KEY_ROLE_FORBIDDEN}:{x[0].name}" for x in TEST_KEYS if x[0] != base_objects.KeyRole.ADMIN])
+async def test_get_admin_keys_403(client, request, headers_fixture):
+    headers = request.getfixturevalue(headers_fixture)
+    r = await client.get("/v1/admin/keys", headers=headers)
     assert r.status_code == 403, r.text
     body = r.json()
     assert body["code"] == AppCode.API_KEY_ROLE_FORBIDDEN.value